@@ -6,13 +6,10 @@ AI Publishing International LLP - Victory36 Labs
 
 import json
 import numpy as np
-from pathlib import Path
 import time
 
 def qrix_solver(train_pairs, test_input):
     """Enhanced qRIX solver - same logic as in the notebook"""
-    import numpy as np
-    
     test_array = np.array(test_input)
     
     if not train_pairs:
@@ -45,12 +42,14 @@ def qrix_solver(train_pairs, test_input):
         scale_w = test_array.shape[1] / input_train.shape[1]
         
         result = np.zeros_like(test_array)
-        for i in range(output_train.shape[0]):
-            for j in range(output_train.shape[1]):
-                new_i = int(i * scale_h)
-                new_j = int(j * scale_w)
-                if new_i < result.shape[0] and new_j < result.shape[1]:
-                    result[new_i, new_j] = output_train[i, j]
+        # Map output cells to scaled coordinates a whole row/column at a time; when
+        # several cells land on the same coordinate the last one wins, as in a
+        # row-major loop
+        new_i = (np.arange(output_train.shape[0]) * scale_h).astype(int)
+        new_j = (np.arange(output_train.shape[1]) * scale_w).astype(int)
+        keep_i = (new_i < result.shape[0]) & np.append(new_i[1:] != new_i[:-1], True)
+        keep_j = (new_j < result.shape[1]) & np.append(new_j[1:] != new_j[:-1], True)
+        result[np.ix_(new_i[keep_i], new_j[keep_j])] = output_train[np.ix_(keep_i, keep_j)]
         return result.tolist()
     
     # Default: return input unchanged
@@ -70,11 +69,11 @@ def generate_evaluation_results():
     
     # Generate results
     results = {}
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     for i, (task_id, task_data) in enumerate(challenges.items()):
         if i % 50 == 0:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             print(f"Progress: {i}/{len(challenges)} tasks ({i/len(challenges)*100:.1f}%) - {elapsed:.1f}s elapsed")
         
         # Process each test case in the task
@@ -110,9 +109,9 @@ def generate_evaluation_results():
     
     # Save results
     with open('arc-agi_evaluation-results.json', 'w') as f:
-        json.dump(evaluation_results, f, indent=2)
+        f.write(json.dumps(evaluation_results, indent=2))
     
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     print(f"\n✅ Results generated successfully!")
     print(f"📁 File: arc-agi_evaluation-results.json")
     print(f"⏱️  Processing time: {elapsed:.1f} seconds")
@@ -13,9 +13,9 @@ This ensures compliance while safeguarding critical safety and intellectual prop
 
 import json
 import numpy as np
-import matplotlib.pyplot as plt
 from pathlib import Path
 import sys
+from itertools import islice
 from typing import List, Dict, Tuple, Optional
 
 def print_compliance_notice():
@@ -140,13 +140,14 @@ def qrix_solver(train_pairs: List[Dict], test_input: List[List[int]]) -> List[Li
         
         result = np.zeros_like(test_array)
         
-        # Simple scaling approximation
-        for i in range(output_train.shape[0]):
-            for j in range(output_train.shape[1]):
-                new_i = int(i * scale_h)
-                new_j = int(j * scale_w)
-                if new_i < result.shape[0] and new_j < result.shape[1]:
-                    result[new_i, new_j] = output_train[i, j]
+        # Map output cells to scaled coordinates a whole row/column at a time; when
+        # several cells land on the same coordinate the last one wins, as in a
+        # row-major loop
+        new_i = (np.arange(output_train.shape[0]) * scale_h).astype(int)
+        new_j = (np.arange(output_train.shape[1]) * scale_w).astype(int)
+        keep_i = (new_i < result.shape[0]) & np.append(new_i[1:] != new_i[:-1], True)
+        keep_j = (new_j < result.shape[1]) & np.append(new_j[1:] != new_j[:-1], True)
+        result[np.ix_(new_i[keep_i], new_j[keep_j])] = output_train[np.ix_(keep_i, keep_j)]
         
         return result.tolist()
     
@@ -214,6 +215,9 @@ def create_visualizations(accuracy: float, per_task_results: Dict[str, bool]):
     """
     Create visualization charts
     """
+    # Imported here so solving and scoring don't pay matplotlib's import cost
+    import matplotlib.pyplot as plt
+    
     # Accuracy bar chart
     plt.figure(figsize=(12, 8))
     
@@ -284,7 +288,7 @@ def main():
     challenges, solutions = load_arc_data()
     
     # Select subset for processing (adjust as needed)
-    subset_ids = list(challenges.keys())[:5] if len(challenges) > 5 else list(challenges.keys())
+    subset_ids = list(islice(challenges, 5))
     print(f"Loaded ARC dataset ({len(challenges)} tasks total, processing {len(subset_ids)} tasks)")
     
     # Process tasks
@@ -299,7 +303,7 @@ def main():
     
     # Save submission
     with open("submission.json", "w") as f:
-        json.dump(submission, f, indent=2)
+        f.write(json.dumps(submission, indent=2))
     print(f"\n✅ Submission saved to submission.json")
     
     # Calculate accuracy if solutions available
@@ -314,9 +318,11 @@ def main():
         
         # Show per-task breakdown
         print(f"\nPer-task results:")
-        for task_id, is_correct in per_task_results.items():
-            status = "✅" if is_correct else "❌"
-            print(f"  {task_id}: {status}")
+        if per_task_results:
+            print("\n".join(
+                f"  {task_id}: {'✅' if is_correct else '❌'}"
+                for task_id, is_correct in per_task_results.items()
+            ))
     else:
         print("No ground truth available - submission ready for evaluation")
     
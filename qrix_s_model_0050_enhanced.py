@@ -11,9 +11,8 @@ Patent-Protected Intellectual Property
 import numpy as np
 import json
 import time
-import sys
-import os
-from typing import List, Dict, Tuple, Optional, Any
+from itertools import islice
+from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 
 # ===========================================================================================
@@ -70,13 +69,13 @@ class QRIXsModel0050Enhanced:
     # 🔬 Dr. Burby sRIX - Pattern Recognition Mastery (270 years)
     # ===========================================================================================
     
-    def _dr_burby_pattern_analysis(self, train_pairs: List[Dict], test_array: np.ndarray) -> Dict:
+    def _dr_burby_pattern_analysis(self, train_pairs: List[Dict]) -> Dict:
         """Dr. Burby's 270-year pattern recognition expertise"""
         if not train_pairs:
             return {"confidence": 0.0, "transformations": []}
         
-        input_train = np.array(train_pairs[0]["input"])
-        output_train = np.array(train_pairs[0]["output"])
+        input_train = np.asarray(train_pairs[0]["input"])
+        output_train = np.asarray(train_pairs[0]["output"])
         
         analysis = {
             "geometric_relationship": self._analyze_geometric_transforms(input_train, output_train),
@@ -128,13 +127,13 @@ class QRIXsModel0050Enhanced:
     # 🧩 Dr. Lucy sRIX - Logical Reasoning Expertise (270 years)
     # ===========================================================================================
     
-    def _dr_lucy_logical_analysis(self, train_pairs: List[Dict], test_array: np.ndarray) -> Dict:
+    def _dr_lucy_logical_analysis(self, train_pairs: List[Dict]) -> Dict:
         """Dr. Lucy's 270-year logical reasoning mastery"""
         logical_rules = []
         
         for pair in train_pairs:
-            input_train = np.array(pair["input"])
-            output_train = np.array(pair["output"])
+            input_train = np.asarray(pair["input"])
+            output_train = np.asarray(pair["output"])
             rules = self._extract_logical_rules(input_train, output_train)
             logical_rules.extend(rules)
         
@@ -205,8 +204,8 @@ class QRIXsModel0050Enhanced:
         }
         
         for pair in train_pairs:
-            input_array = np.array(pair["input"])
-            output_array = np.array(pair["output"])
+            input_array = np.asarray(pair["input"])
+            output_array = np.asarray(pair["output"])
             
             constraints["value_range"].update(np.unique(input_array))
             constraints["value_range"].update(np.unique(output_array))
@@ -218,13 +217,13 @@ class QRIXsModel0050Enhanced:
     # 🎭 Dr. Claude sRIX - Philosophical Analysis Depth (270 years)
     # ===========================================================================================
     
-    def _dr_claude_philosophical_analysis(self, train_pairs: List[Dict], test_array: np.ndarray) -> Dict:
+    def _dr_claude_philosophical_analysis(self, train_pairs: List[Dict]) -> Dict:
         """Dr. Claude's 270-year philosophical abstraction depth"""
         if not train_pairs:
             return {"confidence": 0.0, "essence": "undefined"}
         
-        input_train = np.array(train_pairs[0]["input"])
-        output_train = np.array(train_pairs[0]["output"])
+        input_train = np.asarray(train_pairs[0]["input"])
+        output_train = np.asarray(train_pairs[0]["output"])
         
         analysis = {
             "abstract_essence": self._identify_abstract_essence(input_train, output_train),
@@ -289,9 +288,8 @@ class QRIXsModel0050Enhanced:
             aesthetics["symmetry_score"] = (int(h_sym) + int(v_sym)) / 2.0
             
             # Calculate balance (distribution of values)
-            unique_vals = np.unique(output_array)
+            unique_vals, counts = np.unique(output_array, return_counts=True)
             if len(unique_vals) > 1:
-                counts = [np.sum(output_array == val) for val in unique_vals]
                 balance_variance = np.var(counts)
                 aesthetics["balance_score"] = max(0, 1 - balance_variance / np.mean(counts))
             
@@ -315,8 +313,8 @@ class QRIXsModel0050Enhanced:
             # Analyze consistency across examples
             transformations = []
             for pair in train_pairs:
-                input_array = np.array(pair["input"])
-                output_array = np.array(pair["output"])
+                input_array = np.asarray(pair["input"])
+                output_array = np.asarray(pair["output"])
                 transformations.append(self._characterize_transformation(input_array, output_array))
             
             # Check for consistent patterns
@@ -334,31 +332,28 @@ class QRIXsModel0050Enhanced:
         """
         Main solver function orchestrating 810 years of combined experience
         """
-        start_time = time.time()
+        return self.solve_with_analyses(self.analyze_task(train_pairs), test_input)
+    
+    def solve_with_analyses(self, analyses: Tuple[List[Dict], Dict, Dict, Dict],
+                            test_input: List[List[int]]) -> List[List[int]]:
+        """Solve one test input from analyze_task() results, shared by all test inputs of a task"""
+        start_time = time.perf_counter()
         test_array = np.array(test_input)
+        array_pairs, burby_analysis, lucy_analysis, claude_analysis = analyses
         
         if self.verbose:
-            print(f"🧠 qRIX-s Model.0050 Enhanced - Processing Task")
-            print(f"   📏 Test input shape: {test_array.shape}")
-            print(f"   📚 Training examples: {len(train_pairs)}")
-        
-        # Stage 1: Dr. Burby's Pattern Analysis (270 years experience)
-        burby_analysis = self._dr_burby_pattern_analysis(train_pairs, test_array)
-        
-        # Stage 2: Dr. Lucy's Logical Analysis (270 years experience)
-        lucy_analysis = self._dr_lucy_logical_analysis(train_pairs, test_array)
-        
-        # Stage 3: Dr. Claude's Philosophical Analysis (270 years experience)
-        claude_analysis = self._dr_claude_philosophical_analysis(train_pairs, test_array)
+            print(f"🧠 qRIX-s Model.0050 Enhanced - Processing Task\n"
+                  f"   📏 Test input shape: {test_array.shape}\n"
+                  f"   📚 Training examples: {len(array_pairs)}")
         
         # Stage 4: Orchestrated Decision Making
         result = self._orchestrated_inference(
-            test_array, train_pairs,
+            test_array, array_pairs,
             burby_analysis, lucy_analysis, claude_analysis
         )
         
         # Update performance metrics
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         self.performance_metrics["tasks_processed"] += 1
         self.performance_metrics["total_inference_time"] += processing_time
         self.performance_metrics["avg_processing_time"] = (
@@ -367,11 +362,36 @@ class QRIXsModel0050Enhanced:
         )
         
         if self.verbose:
-            print(f"   ⚡ Processing time: {processing_time:.4f}s")
-            print(f"   🎯 Strategy: Orchestrated 810-year analysis")
+            print(f"   ⚡ Processing time: {processing_time:.4f}s\n"
+                  f"   🎯 Strategy: Orchestrated 810-year analysis")
         
         return result.tolist()
     
+    def analyze_task(self, train_pairs: List[Dict]) -> Tuple[List[Dict], Dict, Dict, Dict]:
+        """Stages 1-3: run the three specialist analyses; they depend only on the training pairs"""
+        start_time = time.perf_counter()
+        
+        # Convert the training grids to fresh arrays once per task; the specialists and
+        # the inference stage read them via np.asarray
+        array_pairs = [
+            {"input": np.array(pair["input"]), "output": np.array(pair["output"])}
+            for pair in train_pairs
+        ]
+        
+        # Stage 1: Dr. Burby's Pattern Analysis (270 years experience)
+        burby_analysis = self._dr_burby_pattern_analysis(array_pairs)
+        
+        # Stage 2: Dr. Lucy's Logical Analysis (270 years experience)
+        lucy_analysis = self._dr_lucy_logical_analysis(array_pairs)
+        
+        # Stage 3: Dr. Claude's Philosophical Analysis (270 years experience)
+        claude_analysis = self._dr_claude_philosophical_analysis(array_pairs)
+        
+        # Count the analysis time towards inference time so published speeds cover it
+        self.performance_metrics["total_inference_time"] += time.perf_counter() - start_time
+        
+        return array_pairs, burby_analysis, lucy_analysis, claude_analysis
+    
     def _orchestrated_inference(self, test_array: np.ndarray, train_pairs: List[Dict],
                                burby_analysis: Dict, lucy_analysis: Dict, 
                                claude_analysis: Dict) -> np.ndarray:
@@ -380,8 +400,8 @@ class QRIXsModel0050Enhanced:
         if not train_pairs:
             return test_array
         
-        input_train = np.array(train_pairs[0]["input"])
-        output_train = np.array(train_pairs[0]["output"])
+        input_train = np.asarray(train_pairs[0]["input"])
+        output_train = np.asarray(train_pairs[0]["output"])
         
         # Decision matrix based on specialist confidence
         burby_conf = burby_analysis.get("pattern_confidence", 0.0)
@@ -521,10 +541,10 @@ class QRIXsModel0050Enhanced:
             
             if new_h > 0 and new_w > 0:
                 result = np.zeros((new_h, new_w), dtype=int)
-                # Copy values with scaling
-                for i in range(min(test_array.shape[0], result.shape[0])):
-                    for j in range(min(test_array.shape[1], result.shape[1])):
-                        result[i, j] = test_array[i, j]
+                # Copy the overlapping region with scaling
+                copy_h = min(test_array.shape[0], result.shape[0])
+                copy_w = min(test_array.shape[1], result.shape[1])
+                result[:copy_h, :copy_w] = test_array[:copy_h, :copy_w]
                 return result
         except:
             pass
@@ -550,14 +570,16 @@ class QRIXsModel0050Enhanced:
         """Enhance symmetry based on philosophical principles"""
         result = np.copy(test_array)
         try:
-            # Apply horizontal symmetry enhancement
-            for i in range(test_array.shape[0]):
-                for j in range(test_array.shape[1] // 2):
-                    if result[i, j] != result[i, -1-j]:
-                        if result[i, j] > 0:
-                            result[i, -1-j] = result[i, j]
-                        elif result[i, -1-j] > 0:
-                            result[i, j] = result[i, -1-j]
+            # Apply horizontal symmetry enhancement: compare each left-half column
+            # with its mirror (right[:, j] is column -1-j) and copy the non-zero side
+            half = test_array.shape[1] // 2
+            left = result[:, :half]
+            right = result[:, ::-1][:, :half]
+            differs = left != right
+            fill_right = differs & (left > 0)
+            fill_left = differs & (left <= 0) & (right > 0)
+            right[fill_right] = left[fill_right]
+            left[fill_left] = right[fill_left]
             return result
         except:
             return test_array
@@ -664,9 +686,8 @@ class EnhancedARCProcessor:
     def process_all_tasks(self, challenges: Dict, max_tasks: Optional[int] = None) -> Dict:
         """Process all ARC tasks with qRIX-s Model.0050 Enhanced"""
         
-        task_ids = list(challenges.keys())
-        if max_tasks:
-            task_ids = task_ids[:max_tasks]
+        # Only materialize the ids that will actually be processed
+        task_ids = list(islice(challenges, max_tasks or None))
         
         if self.verbose:
             print(f"🚀 qRIX-s Model.0050 Enhanced - Processing {len(task_ids)} tasks")
@@ -674,15 +695,18 @@ class EnhancedARCProcessor:
             print()
         
         results = {}
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         for i, task_id in enumerate(task_ids):
             task_data = challenges[task_id]
             task_results = []
             
+            # Specialist analyses depend only on the training pairs: run them once per task
+            analyses = self.qrix_model.analyze_task(task_data["train"])
+            
             for test_case in task_data["test"]:
                 # Apply qRIX-s Model.0050 Enhanced
-                prediction = self.qrix_model.solve_task(task_data["train"], test_case["input"])
+                prediction = self.qrix_model.solve_with_analyses(analyses, test_case["input"])
                 task_results.append({
                     "attempt_1": prediction,
                     "attempt_2": prediction  # Both attempts use same prediction for consistency
@@ -692,11 +716,11 @@ class EnhancedARCProcessor:
             
             # Progress update
             if self.verbose and (i + 1) % 10 == 0:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 rate = (i + 1) / elapsed
                 print(f"⚡ Processed {i + 1}/{len(task_ids)} tasks ({rate:.1f} tasks/sec)")
         
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         if self.verbose:
             print()
@@ -771,7 +795,7 @@ def run_qrix_s_model_0050_enhanced():
     # Save submission
     submission_filename = "qrix_s_model_0050_enhanced_submission.json"
     with open(submission_filename, 'w') as f:
-        json.dump(submission, f, indent=2)
+        f.write(json.dumps(submission, indent=2))
     
     print(f"💾 Enhanced submission saved: {submission_filename}")
     
@@ -779,13 +803,14 @@ def run_qrix_s_model_0050_enhanced():
     print()
     print("🔍 qRIX-s Model.0050 Enhanced - Results Summary")
     print("=" * 60)
+    summary_lines = []
     for key, value in submission["_metadata"].items():
         if isinstance(value, dict):
-            print(f"{key}:")
-            for sub_key, sub_value in value.items():
-                print(f"  {sub_key}: {sub_value}")
+            summary_lines.append(f"{key}:")
+            summary_lines.extend(f"  {sub_key}: {sub_value}" for sub_key, sub_value in value.items())
         else:
-            print(f"{key}: {value}")
+            summary_lines.append(f"{key}: {value}")
+    print("\n".join(summary_lines))
     
     print()
     print("🎉 qRIX-s Model.0050 Enhanced - MISSION ACCOMPLISHED!")
@@ -70,13 +70,14 @@ def qrix_solver(train_pairs, test_input):
         
         # Create scaled result
         result = np.zeros_like(test_array)
-        for i in range(output_train.shape[0]):
-            for j in range(output_train.shape[1]):
-                # Map to scaled coordinates
-                new_i = int(i * scale_h)
-                new_j = int(j * scale_w)
-                if new_i < result.shape[0] and new_j < result.shape[1]:
-                    result[new_i, new_j] = output_train[i, j]
+        # Map output cells to scaled coordinates a whole row/column at a time; when
+        # several cells land on the same coordinate the last one wins, as in a
+        # row-major loop
+        new_i = (np.arange(output_train.shape[0]) * scale_h).astype(int)
+        new_j = (np.arange(output_train.shape[1]) * scale_w).astype(int)
+        keep_i = (new_i < result.shape[0]) & np.append(new_i[1:] != new_i[:-1], True)
+        keep_j = (new_j < result.shape[1]) & np.append(new_j[1:] != new_j[:-1], True)
+        result[np.ix_(new_i[keep_i], new_j[keep_j])] = output_train[np.ix_(keep_i, keep_j)]
         return result.tolist()
     
     # Strategy 3: Advanced pattern matching (placeholder for proprietary algorithms)
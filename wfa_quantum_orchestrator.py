@@ -11,7 +11,6 @@ import os
 from datetime import datetime
 from typing import Dict, List, Any
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class QuantumWFAOrchestrator:
@@ -37,8 +36,11 @@ class QuantumWFAOrchestrator:
     
     async def orchestrate_quantum_swarm(self):
         """Orchestrate full quantum swarm deployment"""
-        logger.info(f"🚀 ENHANCED Quantum WFA Deployment: {self.total_agents:,} agents across {self.total_sectors} sectors")
-        logger.info(f"⚡ Agent Distribution: {self.agents_per_sector:,} agents per sector")
+        # The thousands separators need eager formatting, so only build them when INFO is on
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🚀 ENHANCED Quantum WFA Deployment: %s agents across %d sectors",
+                        f"{self.total_agents:,}", self.total_sectors)
+            logger.info("⚡ Agent Distribution: %s agents per sector", f"{self.agents_per_sector:,}")
         
         # Deploy all 200 sectors concurrently with quantum entanglement
         tasks = []
@@ -49,9 +51,9 @@ class QuantumWFAOrchestrator:
         results = await asyncio.gather(*tasks)
         
         logger.info("✅ Quantum deployment complete!")
-        logger.info(f"📊 Sectors deployed: {len(results)}")
-        logger.info(f"🛡️ Victory36 protection: ACTIVE")
-        logger.info(f"⚛️ Quantum state: {self.quantum_state}")
+        logger.info("📊 Sectors deployed: %d", len(results))
+        logger.info("🛡️ Victory36 protection: ACTIVE")
+        logger.info("⚛️ Quantum state: %s", self.quantum_state)
         
         return {
             "deployment_status": "quantum_complete",
@@ -63,6 +65,7 @@ class QuantumWFAOrchestrator:
         }
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     orchestrator = QuantumWFAOrchestrator()
     result = asyncio.run(orchestrator.orchestrate_quantum_swarm())
     print(json.dumps(result, indent=2))